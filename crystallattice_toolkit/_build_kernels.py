@@ -0,0 +1,43 @@
+"""
+Ahead-of-time build of the Numba kernels in `_numba_kernels`.
+
+Run
+
+    python -m crystallattice_toolkit._build_kernels
+
+to write the `_ckernels` extension module next to the package, removing the
+first-call JIT compile. The extension records a CRC of `_numba_kernels.py`;
+after editing that file, rebuild, or the stale extension is ignored with a
+warning. This module is not imported by the package itself.
+"""
+import os
+import zlib
+
+from numba.pycc import CC
+
+from ._numba_kernels import _filter_pairs
+
+
+def build() -> None:
+    """
+    Compile `_ckernels` into the package directory.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(here, '_numba_kernels.py'), 'rb') as fh:
+        crc = zlib.crc32(fh.read())
+
+    def source_crc():
+        return crc
+
+    cc = CC('_ckernels')
+    cc.output_dir = here
+    cc.export(
+        'filter_pairs',
+        'Tuple((i8[:], i8[:], f8[:]))(i8[:, :], f8[:, :], i8, i8)'
+    )(_filter_pairs)
+    cc.export('source_crc', 'i8()')(source_crc)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,43 @@
+"""
+Numba kernels, JIT-compiled (and cached on disk) on first use.
+
+`_build_kernels` compiles them ahead of time into the `_ckernels` extension,
+which callers prefer when it was built from this exact file.
+The parallel marching-cubes kernels are not included: AOT compilation does
+not support `parallel=True`, and the cached JIT build is faster.
+"""
+import numpy as np
+from numba import njit
+
+
+def _filter_pairs(pairs, cart_images, n_atoms, centre):
+    """
+    Numba equivalent of `lattice._filter_pairs_numpy`.
+    """
+    n_pairs = pairs.shape[0]
+    i_arr = np.empty(n_pairs, dtype=np.int64)
+    j_arr = np.empty(n_pairs, dtype=np.int64)
+    d_arr = np.empty(n_pairs, dtype=np.float64)
+    count = 0
+    for p in range(n_pairs):
+        idx1 = pairs[p, 0]
+        idx2 = pairs[p, 1]
+        i = idx1 % n_atoms
+        j = idx2 % n_atoms
+        if idx1 // n_atoms == centre and i < j:
+            lo, hi = i, j
+        elif idx2 // n_atoms == centre and j < i:
+            lo, hi = j, i
+        else:
+            continue
+        dx = cart_images[idx1, 0] - cart_images[idx2, 0]
+        dy = cart_images[idx1, 1] - cart_images[idx2, 1]
+        dz = cart_images[idx1, 2] - cart_images[idx2, 2]
+        i_arr[count] = lo
+        j_arr[count] = hi
+        d_arr[count] = np.sqrt(dx*dx + dy*dy + dz*dz)
+        count += 1
+    return i_arr[:count], j_arr[:count], d_arr[:count]
+
+
+filter_pairs = njit(cache=True)(_filter_pairs)
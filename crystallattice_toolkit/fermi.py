@@ -2,8 +2,14 @@
 Fermi-surface reconstruction from electronic band data.
 """
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator, RegularGridInterpolator
+from scipy.ndimage import distance_transform_edt
+from scipy.spatial import Delaunay
 from skimage.measure import marching_cubes
+try:
+    from . import _marching_cubes
+except ImportError:  # numba is optional
+    _marching_cubes = None
 from .reciprocal import ReciprocalLattice
 
 class FermiSurface:
@@ -14,17 +20,88 @@ class FermiSurface:
         self,
         reciprocal_lattice: ReciprocalLattice,
         kpoints: np.ndarray,
-        energies: np.ndarray
+        energies: np.ndarray,
+        dtype: np.dtype = np.float32
     ):
         """
         Args:
             reciprocal_lattice: ReciprocalLattice instance.
             kpoints: M×3 array of k-point coordinates.
             energies: M×B array (or M,) of band energies.
+            dtype: floating-point type used to store energies and the
+                interpolated grid. float32 locates the isosurface to well
+                within a voxel; pass np.float64 to keep full precision.
         """
         self.reciprocal = reciprocal_lattice
         self.kpoints = kpoints
-        self.energies = energies
+        self.energies = np.asarray(energies, dtype=dtype)
+        # Mesh detection and triangulation of kpoints, built lazily
+        self._cached_kpoints = None
+        self._mesh = None
+        self._mesh_checked = False
+        self._tri = None
+
+    def _refresh_kpoint_cache(self) -> None:
+        """
+        Drop cached k-point data if kpoints changed (reassigned or edited in place).
+        """
+        kpoints = np.asarray(self.kpoints)
+        if self._cached_kpoints is None or not np.array_equal(kpoints, self._cached_kpoints):
+            self._cached_kpoints = kpoints.copy()
+            self._mesh = None
+            self._mesh_checked = False
+            self._tri = None
+
+    def _kpoint_mesh(self):
+        """
+        Cached result of `_regular_grid` for the current kpoints.
+        """
+        self._refresh_kpoint_cache()
+        if not self._mesh_checked:
+            kpoints_frac = self.reciprocal.cart_to_frac(self._cached_kpoints)
+            self._mesh = self._regular_grid(kpoints_frac)
+            self._mesh_checked = True
+        return self._mesh
+
+    def _scattered_interpolator(self, energies: np.ndarray) -> LinearNDInterpolator:
+        """
+        Linear interpolator over the cached Delaunay triangulation of kpoints.
+
+        The triangulation depends only on kpoints, so it is reused across
+        calls; the interpolator is rebuilt from the current energies each time.
+        """
+        self._refresh_kpoint_cache()
+        if self._tri is None:
+            self._tri = Delaunay(self._cached_kpoints)
+        return LinearNDInterpolator(self._tri, energies)
+
+    def _regular_grid(self, kpoints_frac: np.ndarray):
+        """
+        Detect whether fractional k-points form a complete regular mesh.
+
+        Returns:
+            (axes, index) where axes are the three sorted 1D grid axes and index
+            maps each k-point to its (i, j, k) mesh position, or None if the
+            points are scattered.
+        """
+        keys = np.round(kpoints_frac, decimals=8)
+        axes, index = [], []
+        for col in keys.T:
+            ax, inv = np.unique(col, return_inverse=True)
+            if ax.size < 2:
+                return None
+            step = np.diff(ax)
+            if not np.allclose(step, step[0]):
+                return None
+            axes.append(ax)
+            index.append(inv.ravel())
+        shape = tuple(ax.size for ax in axes)
+        if np.prod(shape) != len(keys):
+            return None
+        flat = np.ravel_multi_index(index, shape)
+        if np.unique(flat).size != flat.size:
+            return None
+        return axes, tuple(index)
 
     def interpolate_on_grid(
         self,
@@ -37,28 +114,79 @@ class FermiSurface:
             grid_x, grid_y, grid_z: 3D coordinate arrays.
             grid_e: energy values on grid.
         """
-        # Define grid in reciprocal cell
-        verts = self.reciprocal.basis
-        # Create meshgrid in fractional coordinates
         lin = np.linspace(0, 1, resolution)
-        fx, fy, fz = np.meshgrid(lin, lin, lin, indexing='ij')
-        pts_frac = np.vstack([fx.ravel(), fy.ravel(), fz.ravel()]).T
-        pts_cart = pts_frac.dot(verts)
-        # Interpolate
-        grid_e = griddata(self.kpoints, self.energies, pts_cart, method='linear')
-        grid_e = grid_e.reshape((resolution, resolution, resolution))
+        energies = np.asarray(self.energies)
+        # Fast path: Monkhorst–Pack style inputs use tensor-product interpolation
+        mesh = self._kpoint_mesh()
+        if mesh is not None:
+            axes, index = mesh
+            values = np.empty(
+                tuple(ax.size for ax in axes) + energies.shape[1:], dtype=energies.dtype
+            )
+            values[index] = energies
+            interp = RegularGridInterpolator(
+                axes, values, method='linear', bounds_error=False, fill_value=np.nan
+            )
+            # Query in fractional coordinates
+            b1, b2, b3 = np.eye(3)
+        else:
+            interp = self._scattered_interpolator(energies)
+            # Query in Cartesian coordinates
+            b1, b2, b3 = self.reciprocal.basis
+
+        # Grid points are the tensor product lin[i]*b1 + lin[j]*b2 + lin[k]*b3.
+        # Evaluate one x-slab at a time so only resolution² query points
+        # are held in memory at once.
+        plane = lin[:, None, None] * b2 + lin[None, :, None] * b3
+        slab = np.empty_like(plane)
+        grid_e = np.empty((resolution,) * 3 + energies.shape[1:], dtype=energies.dtype)
+        for i in range(resolution):
+            np.add(plane, lin[i] * b1, out=slab)
+            grid_e[i] = interp(slab.reshape(-1, 3)).reshape(grid_e.shape[1:])
+        # Broadcast views: the coordinate arrays cost no extra memory
+        fx, fy, fz = np.meshgrid(lin, lin, lin, indexing='ij', copy=False)
         return fx, fy, fz, grid_e
 
     def mesh_isosurface(
         self,
         fermi_level: float,
-        resolution: int = 50
+        resolution: int = 50,
+        method: str = 'skimage'
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Extract mesh (verts, faces) of constant-energy surface at Fermi level.
+
+        Grid points the interpolation leaves undefined (NaN, outside the
+        sampled k-points) take the value of the nearest defined point, so the
+        surface is neither capped nor broken where the data ends.
+
+        Args:
+            fermi_level: energy of the isosurface.
+            resolution: number of grid points along each reciprocal axis.
+            method: 'skimage' (default) or 'numba', the optional multithreaded
+                Numba kernel. Both give the same vertices; ambiguous cubes may
+                be split along a different diagonal.
         """
-        fx, fy, fz, grid_e = self.interpolate_on_grid(resolution)
-        verts, faces, normals, values = marching_cubes(grid_e, level=fermi_level)
-        # Convert fractional vertices to Cartesian
-        verts_cart = np.dot(verts / (resolution-1), self.reciprocal.basis)
+        _, _, _, grid_e = self.interpolate_on_grid(resolution)
+        undefined = np.isnan(grid_e)
+        if undefined.all():
+            raise ValueError("Interpolated grid contains no finite energies.")
+        if undefined.any():
+            nearest = distance_transform_edt(
+                undefined, return_distances=False, return_indices=True
+            )
+            grid_e = grid_e[tuple(nearest)]
+        if method == 'skimage':
+            extract = marching_cubes
+        elif method == 'numba':
+            if _marching_cubes is None:
+                raise ImportError("method='numba' requires numba to be installed")
+            extract = _marching_cubes.marching_cubes
+        else:
+            raise ValueError(f"Unknown method {method!r}; use 'skimage' or 'numba'")
+        verts, faces, normals, values = extract(grid_e, level=fermi_level)
+        # Convert voxel-index vertices to Cartesian in a single matmul
+        to_cart = self.reciprocal.basis / (resolution - 1)
+        verts_cart = np.empty(verts.shape, dtype=np.result_type(verts, to_cart))
+        np.matmul(verts, to_cart, out=verts_cart)
         return verts_cart, faces, normals
\ No newline at end of file
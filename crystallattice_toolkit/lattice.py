@@ -1,9 +1,78 @@
 """
 Module for building real‐space crystal lattices.
 """
+import os
+import warnings
+import zlib
+
 import numpy as np
 from scipy.spatial import cKDTree
 
+
+def _filter_pairs_numpy(
+    pairs: np.ndarray,
+    cart_images: np.ndarray,
+    n_atoms: int,
+    centre: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map image-pair indices back to atoms and compute distances.
+
+    Only pairs with at least one member in the central image block are kept,
+    oriented so that the central atom is i and i<j.
+
+    Args:
+        pairs: P×2 integer array of indices into cart_images.
+        cart_images: Cartesian positions of all periodic images.
+        n_atoms: number of atoms in the unit cell.
+        centre: index of the zero-shift image block.
+
+    Returns:
+        i, j, d: 1D arrays of atom indices and pair distances.
+    """
+    a, b = pairs[:, 0], pairs[:, 1]
+    ia, ib = a % n_atoms, b % n_atoms
+    fwd = (a // n_atoms == centre) & (ia < ib)
+    rev = (b // n_atoms == centre) & (ib < ia)
+    i = np.concatenate([ia[fwd], ib[rev]])
+    j = np.concatenate([ib[fwd], ia[rev]])
+    diff = cart_images[np.concatenate([a[fwd], a[rev]])] \
+        - cart_images[np.concatenate([b[fwd], b[rev]])]
+    d = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    return i, j, d
+
+
+def _load_filter_pairs():
+    """
+    Pick the fastest available pair filter.
+
+    Prefers the AOT-built `_ckernels` extension, but only if its recorded
+    checksum matches the current `_numba_kernels.py`; a stale build is
+    skipped with a warning. Falls back to the JIT kernel, then to NumPy.
+    """
+    try:
+        from . import _ckernels
+    except ImportError:
+        pass
+    else:
+        path = os.path.join(os.path.dirname(__file__), '_numba_kernels.py')
+        with open(path, 'rb') as fh:
+            fresh = _ckernels.source_crc() == zlib.crc32(fh.read())
+        if fresh:
+            return _ckernels.filter_pairs
+        warnings.warn(
+            "_ckernels is out of date with _numba_kernels.py and is ignored; "
+            "rebuild it with 'python -m crystallattice_toolkit._build_kernels'"
+        )
+    try:
+        from ._numba_kernels import filter_pairs
+    except ImportError:  # numba is optional
+        return _filter_pairs_numpy
+    return filter_pairs
+
+
+_filter_pairs = _load_filter_pairs()
+
 class Lattice:
     """
     Represents a crystal lattice in Cartesian coordinates.
@@ -51,36 +120,51 @@ class Lattice:
         """
         Find atomic pairs within a given distance cutoff (periodic images included).
 
+        Every periodic image of atom j lying within the cutoff of atom i in the
+        home cell yields one entry, so a pair may appear more than once when the
+        cutoff exceeds half a cell length.
+
         Args:
             cutoff: float, distance threshold in same units as lattice_vectors.
 
         Returns:
             neighbors: list of tuples (i, j, distance) with i<j.
         """
-        # Build supercell points within one extra shell
-        # Generate 3^3 neighbour images
-        shifts = np.array([[i, j, k]
-                           for i in (-1, 0, 1)
-                           for j in (-1, 0, 1)
-                           for k in (-1, 0, 1)])
-        # Expand positions
-        frac_images = (self.positions_frac[None, :, :] + shifts[:, None, :])  # (27, N, 3)
+        N = len(self.positions_frac)
+        box = np.diag(self.lattice_vectors)
+        orthorhombic = (
+            np.allclose(self.lattice_vectors, np.diag(box)) and np.all(box > 0)
+        )
+        if orthorhombic and cutoff < 0.5 * box.min():
+            # Only the minimum image can lie within the cutoff, so let the
+            # tree handle periodicity directly.
+            cart = np.mod(self.positions_frac, 1.0) * box
+            cart[cart >= box] = 0.0
+            tree = cKDTree(cart, boxsize=box)
+            pairs = tree.query_pairs(r=cutoff, output_type='ndarray')
+            diff = cart[pairs[:, 1]] - cart[pairs[:, 0]]
+            diff -= box * np.round(diff / box)
+            d = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+            return list(zip(pairs[:, 0].tolist(), pairs[:, 1].tolist(), d.tolist()))
+
+        # General cell: replicate only the images that can reach the home cell.
+        # Plane spacing along axis k is 1/|row k of inv(A).T|.
+        spacing = 1.0 / np.linalg.norm(np.linalg.inv(self.lattice_vectors), axis=0)
+        reach = np.ceil(cutoff / spacing).astype(int)
+        shifts = np.mgrid[-reach[0]:reach[0] + 1,
+                          -reach[1]:reach[1] + 1,
+                          -reach[2]:reach[2] + 1].reshape(3, -1).T
+        centre = len(shifts) // 2
+        frac_images = (self.positions_frac[None, :, :] + shifts[:, None, :])
         frac_images = frac_images.reshape(-1, 3)
         cart_images = frac_images.dot(self.lattice_vectors)
 
         tree = cKDTree(cart_images)
-        pairs = tree.query_pairs(r=cutoff, output_type='set')
+        pairs = tree.query_pairs(r=cutoff, output_type='ndarray')
 
-        N = len(self.positions_frac)
-        neighbors = []
-        for idx1, idx2 in pairs:
-            # Map flat indices back to original atoms
-            i = idx1 % N
-            j = idx2 % N
-            if i < j:
-                d = np.linalg.norm(cart_images[idx1] - cart_images[idx2])
-                neighbors.append((i, j, d))
-        return neighbors
+        # Map flat indices back to original atoms
+        i, j, d = _filter_pairs(pairs, cart_images, N, centre)
+        return list(zip(i.tolist(), j.tolist(), d.tolist()))
 
     def make_supercell(
         self,
@@ -96,12 +180,11 @@ class Lattice:
             supercell (Lattice): new Lattice object.
         """
         na, nb, nc = multipliers
-        shifts = np.array([[i, j, k]
-                           for i in range(na)
-                           for j in range(nb)
-                           for k in range(nc)])
-        new_frac = (self.positions_frac[None, :, :] + shifts[:, None, :])
-        new_frac = new_frac.reshape(-1, 3) / np.array([na, nb, nc])
+        shifts = np.mgrid[0:na, 0:nb, 0:nc].reshape(3, -1).T.astype(float)
+        new_frac = np.empty((len(shifts), len(self.positions_frac), 3))
+        np.add(self.positions_frac[None, :, :], shifts[:, None, :], out=new_frac)
+        new_frac = new_frac.reshape(-1, 3)
+        new_frac /= np.array([na, nb, nc])
         new_species = self.species * len(shifts)
         new_vectors = np.vstack([
             self.lattice_vectors[0] * na,
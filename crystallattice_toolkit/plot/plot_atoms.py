@@ -1,5 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+_DEFAULT_PALETTE = plt.cm.tab10.colors
 
 def plot_atoms(lattice, species=None, ax=None, show_cell=True, atom_size=300, colours=None):
     """
@@ -33,13 +36,18 @@ def plot_atoms(lattice, species=None, ax=None, show_cell=True, atom_size=300, co
     if colours is None:
         colours = {}
     unique_species = sorted(set(species))
-    default_palette = plt.cm.tab10.colors
-    for i, sp in enumerate(unique_species):
-        if sp not in colours:
-            colours[sp] = default_palette[i % len(default_palette)]
+    colours = {
+        sp: colours.get(sp, _DEFAULT_PALETTE[i % len(_DEFAULT_PALETTE)])
+        for i, sp in enumerate(unique_species)
+    }
 
-    for coord, sp in zip(cart_coords, species):
-        ax.scatter(*coord, s=atom_size, c=[colours[sp]], label=sp)
+    species_arr = np.asarray(species)
+    for sp in unique_species:
+        mask = species_arr == sp
+        ax.scatter(
+            cart_coords[mask, 0], cart_coords[mask, 1], cart_coords[mask, 2],
+            s=atom_size, c=[colours[sp]], label=sp
+        )
 
     if show_cell:
         draw_unit_cell(ax, lattice_vectors)
@@ -74,6 +82,9 @@ def draw_unit_cell(ax, lattice_vectors):
         (3,5), (3,6),
         (4,7), (5,7), (6,7)
     ]
-    for start, end in edges:
-        xs, ys, zs = zip(corners[start], corners[end])
-        ax.plot(xs, ys, zs, color='k', linewidth=0.5, alpha=0.7)
+    segments = [corners[[start, end]] for start, end in edges]
+    ax.add_collection3d(
+        Line3DCollection(segments, colors='k', linewidths=0.5, alpha=0.7)
+    )
+    # add_collection3d only updates the data limits on matplotlib >= 3.10
+    ax.auto_scale_xyz(corners[:, 0], corners[:, 1], corners[:, 2], had_data=True)
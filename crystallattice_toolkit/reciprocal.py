@@ -2,43 +2,73 @@
 Reciprocal lattice and first Brillouin zone computation.
 """
 import numpy as np
-from scipy.spatial import ConvexHull
+from scipy.spatial import HalfspaceIntersection
 from .lattice import Lattice
 
 class ReciprocalLattice:
     """
     Represents the reciprocal-space lattice of a real-space Lattice.
+
+    Attributes:
+        basis (np.ndarray): 3×3 array of reciprocal basis vectors (rows are vectors).
+        volume (float): volume of the reciprocal unit cell (and of the first BZ).
     """
     def __init__(self, real_lattice: Lattice):
         """
         Compute reciprocal basis vectors.
         """
-        a1, a2, a3 = real_lattice.lattice_vectors
-        vol = np.dot(a1, np.cross(a2, a3))
-        b1 = 2*np.pi * np.cross(a2, a3) / vol
-        b2 = 2*np.pi * np.cross(a3, a1) / vol
-        b3 = 2*np.pi * np.cross(a1, a2) / vol
-        self.basis = np.vstack([b1, b2, b3])
+        A = real_lattice.lattice_vectors
+        self.basis = 2*np.pi * np.linalg.inv(A).T
+        # Inverse of the reciprocal basis, for Cartesian → fractional maps
+        self._inv_basis = A.T / (2*np.pi)
+        self.volume = abs(np.linalg.det(self.basis))
+
+    def cart_to_frac(self, k_cart: np.ndarray) -> np.ndarray:
+        """
+        Convert Cartesian k-points to fractional reciprocal coordinates.
+        """
+        return np.asarray(k_cart) @ self._inv_basis
+
+    def frac_to_cart(self, k_frac: np.ndarray) -> np.ndarray:
+        """
+        Convert fractional reciprocal coordinates to Cartesian k-points.
+        """
+        return np.asarray(k_frac) @ self.basis
 
     def get_reciprocal_points(self, shell: int=1) -> np.ndarray:
         """
         Generate reciprocal lattice points within given shell.
         """
-        shifts = [np.array([i,j,k]) for i in range(-shell,shell+1)
-                  for j in range(-shell,shell+1)
-                  for k in range(-shell,shell+1)]
-        pts = np.array([s.dot(self.basis) for s in shifts])
+        shifts = np.mgrid[-shell:shell+1, -shell:shell+1, -shell:shell+1]
+        shifts = shifts.reshape(3, -1).T.astype(float)
+        pts = shifts @ self.basis
         return pts
 
     def first_brillouin_zone(self) -> np.ndarray:
         """
-        Compute vertices of the first Brillouin zone via convex hull of Wigner–Seitz cell.
+        Compute vertices of the first Brillouin zone (Wigner–Seitz cell).
+
+        The zone is the intersection of the half-spaces G·k ≤ |G|²/2 over the
+        26 nearest reciprocal lattice vectors G, so a reasonably reduced
+        basis is assumed.
 
         Returns:
             vertices: P×3 array of BZ vertex coordinates.
         """
         pts = self.get_reciprocal_points(shell=1)
-        # Voronoi cell at origin approximated by points within one shell
-        hull = ConvexHull(pts)
-        vertices = pts[hull.vertices]
-        return vertices
\ No newline at end of file
+        G = pts[np.any(pts != 0, axis=1)]
+        norm2 = np.einsum('ij,ij->i', G, G)
+        # A facet is centred on G_i/2, so plane i is redundant if some other
+        # half-space j excludes (or just touches) that point: G_j·G_i ≥ |G_j|²
+        overlap = G @ G.T
+        np.fill_diagonal(overlap, -np.inf)
+        keep = ~np.any(overlap >= norm2[:, None] * (1 - 1e-10), axis=0)
+        halfspaces = np.hstack([G[keep], -0.5 * norm2[keep, None]])
+        hs = HalfspaceIntersection(halfspaces, np.zeros(3))
+        # Vertices shared by more than three planes are reported repeatedly
+        scale = np.abs(hs.intersections).max()
+        _, first = np.unique(
+            np.round(hs.intersections / scale, decimals=8), axis=0, return_index=True
+        )
+        vertices = hs.intersections[np.sort(first)]
+        return vertices
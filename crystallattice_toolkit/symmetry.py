@@ -9,6 +9,9 @@ class SpaceGroup:
     """
     Wrap spglib to extract symmetry operations for a given lattice.
 
+    Symmetry results are cached per symprec; the spglib cell is built once
+    from the lattice at construction time.
+
     Attributes:
         spg_number (int): International space-group number (1–230).
         lattice (Lattice): Real-space lattice object.
@@ -30,6 +33,14 @@ class SpaceGroup:
         self.spg_number = spg_number
         self.lattice = lattice
         self.symprec = symprec
+        # spglib only needs distinct integer labels per species
+        _, numbers = np.unique(lattice.species, return_inverse=True)
+        self._cell = (
+            lattice.lattice_vectors,
+            lattice.positions_frac,
+            numbers.astype(np.intc)
+        )
+        self._cache = {}
 
     def get_symmetry_operations(self) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -38,25 +49,25 @@ class SpaceGroup:
         Returns:
             rotations: M×3×3 array of integer rotation matrices.
             translations: M×3 array of fractional translations.
+
+        Both arrays are cached and shared between calls, so they are read-only.
         """
-        cell = (
-            self.lattice.lattice_vectors,
-            self.lattice.positions_frac,
-            self.lattice.species
-        )
-        sym_data = spglib.get_symmetry(cell, symprec=self.symprec)
-        rotations = np.array(sym_data['rotations'], dtype=int)
-        translations = np.array(sym_data['translations'], dtype=float)
-        return rotations, translations
+        key = ('symmetry', self.symprec)
+        if key not in self._cache:
+            sym_data = spglib.get_symmetry(self._cell, symprec=self.symprec)
+            # spglib already returns int32/float64 arrays, so these do not copy
+            rotations = np.ascontiguousarray(sym_data['rotations'], dtype=np.intc)
+            translations = np.ascontiguousarray(sym_data['translations'], dtype=np.float64)
+            rotations.flags.writeable = False
+            translations.flags.writeable = False
+            self._cache[key] = (rotations, translations)
+        return self._cache[key]
 
     def get_spacegroup_symbol(self) -> str:
         """
         Return Hermann–Mauguin symbol for the space group.
         """
-        cell = (
-            self.lattice.lattice_vectors,
-            self.lattice.positions_frac,
-            self.lattice.species
-        )
-        dataset = spglib.get_spacegroup(cell, symprec=self.symprec)
-        return dataset
\ No newline at end of file
+        key = ('symbol', self.symprec)
+        if key not in self._cache:
+            self._cache[key] = spglib.get_spacegroup(self._cell, symprec=self.symprec)
+        return self._cache[key]
\ No newline at end of file